@@ -10,7 +10,7 @@ from os import path
 import logging
 import datetime
 from importlib.metadata import version
-from typing import Union, Type, Any
+from typing import Union, Type, Any, Optional
 from i18n import t
 
 from discord.ext import commands
@@ -20,13 +20,48 @@ from .help import EmbedHelpCommand
 from .tree import CommandTree
 from .utils import (config, config_init, logging_init, i18n_init, set_locale, sanitize,
                     fallback_reply, get_command_usage, log_command_error, log_data,
-                    CaseInsensitiveStringView as StringView)
+                    CaseInsensitiveStringView as StringView, _flush_log_messages, _find_error_handler)
 
 __all__ = ('Bot',)
 
 _log = logging.getLogger(__name__)
 
 
+def _usage_kwargs(bot: commands.Bot, ctx: commands.Context, error: Exception) -> dict:
+    return {
+        "command_usage": get_command_usage(bot.command_prefix, ctx.command),
+        "help_command": bot.command_prefix + "help " + ctx.command.name,
+    }
+
+
+def _cooldown_kwargs(bot: commands.Bot, ctx: commands.Context, error: commands.CommandOnCooldown) -> dict:
+    return {"cooldown_time": "<t:" + str(int(time.time() + error.retry_after)) + ":R>"}
+
+
+# Map the handled command errors to the translation key of the reply, the logged
+# reason and the function giving the translation arguments, if any
+_ERROR_HANDLERS = {
+    commands.ConversionError: ("command_error.bad_argument", "Bad arguments given", _usage_kwargs),
+    commands.BadArgument: ("command_error.bad_argument", "Bad arguments given", _usage_kwargs),
+    commands.MissingRequiredArgument: (
+        "command_error.missing_argument", "Missing required argument", _usage_kwargs),
+    commands.BotMissingPermissions: ("command_error.bot_missing_permission", "Bot is missing permissions", None),
+    commands.NotOwner: ("command_error.user_missing_permission", "User is missing permissions", None),
+    commands.MissingPermissions: ("command_error.user_missing_permission", "User is missing permissions", None),
+    commands.CommandOnCooldown: ("command_error.on_cooldown", "On cooldown", _cooldown_kwargs),
+    commands.InvalidEndOfQuotedStringError: ("command_error.invalid_quoted_string", "Invalid quoted string", None),
+    commands.ExpectedClosingQuoteError: ("command_error.invalid_quoted_string", "Invalid quoted string", None),
+    commands.PrivateMessageOnly: ("command_error.private_message_only", "Private message only", None),
+    commands.NoPrivateMessage: ("command_error.no_private_message", "No private message", None),
+}
+
+# Same as above, for the exceptions wrapped in a CommandInvokeError
+_INVOKE_ERROR_HANDLERS = {
+    discord.Forbidden: ("command_error.bot_missing_permission", "Bot is missing permissions", None),
+    discord.NotFound: ("command_error.not_found", "No matches for the request", None),
+}
+
+
 class NoSpecifiedTokenError(Exception):
     """
     a basic custom error, in case no token is specified
@@ -34,6 +69,22 @@ class NoSpecifiedTokenError(Exception):
     pass
 
 
+class _Context(commands.Context):
+    """
+    A context keeping track of the last reply sent to the invoking message
+    """
+
+    last_reply: Optional[discord.Message] = None
+
+    async def send(self, *args, **kwargs) -> discord.Message:
+        message = await super().send(*args, **kwargs)
+        reference = kwargs.get('reference')
+        if reference is not None and self.interaction is None and \
+                getattr(reference, 'message_id', getattr(reference, 'id', None)) == self.message.id:
+            self.last_reply = message
+        return message
+
+
 class Bot(commands.AutoShardedBot):
     """
     The class representing the Discord bot
@@ -48,6 +99,7 @@ class Bot(commands.AutoShardedBot):
 
         self.start_time = None
         self.initialisation_time = datetime.datetime.now()
+        self._synced_tree_generation = None
 
         config_init(**kwargs)
         logging_init(**kwargs)
@@ -136,6 +188,11 @@ class Bot(commands.AutoShardedBot):
     def __exit__(self, exc_type, exc_val, exc_tb):
         return self.run()
 
+    async def close(self) -> None:
+        # the error reports still queued for the log channel are sent while the connection is open
+        await _flush_log_messages()
+        await super().close()
+
     async def on_connect(self):
         _log.info(
             f"Connected to Discord as {self.user.name!r} "
@@ -144,14 +201,19 @@ class Bot(commands.AutoShardedBot):
 
     async def on_ready(self):
         self.start_time = datetime.datetime.now()
-        if self.application_id:
+        # on_ready is called again after each reconnection, only sync the tree if it changed since.
+        # The tree generation counts every command change, including extension (un)loads
+        tree_generation = getattr(self.tree, 'generation', None)
+        if self.application_id and (tree_generation is None or tree_generation != self._synced_tree_generation):
             sync_res = await self.tree.sync()
             if sync_res is None:
                 _log.error("Failed to sync the tree")
-            elif sync_res:
-                _log.info(f"Slash commands successfully synced: {', '.join([repr(c.name) for c in sync_res])}")
             else:
-                _log.info("No slash commands to sync")
+                self._synced_tree_generation = tree_generation
+                if sync_res:
+                    _log.info(f"Slash commands successfully synced: {', '.join([repr(c.name) for c in sync_res])}")
+                else:
+                    _log.info("No slash commands to sync")
         _log.info(f"Bot launched in {(self.start_time - self.initialisation_time).total_seconds():.3f}s,"
                   f" ready to use (prefix {self.command_prefix!r})")
 
@@ -238,7 +300,7 @@ class Bot(commands.AutoShardedBot):
             ``cls`` parameter.
         """
         if cls is discord.utils.MISSING:
-            cls = commands.Context
+            cls = _Context
 
         if isinstance(origin, discord.Interaction):
             return await cls.from_interaction(origin)
@@ -303,12 +365,13 @@ class Bot(commands.AutoShardedBot):
         .. deprecated:: 0.4
         """
 
-        if ctx.interaction or not config.log.commands:
+        if ctx.interaction or not config.log.commands or not _log.isEnabledFor(logging.INFO):
             return
 
+        author = ctx.author
         _log.info(
-            f"{ctx.command.name!r} command request sent by {str(ctx.author)!r} "
-            f"({ctx.author.id!r}) with invocation {ctx.message.content!r}")
+            "%r command request sent by %r (%r) with invocation %r",
+            ctx.command.name, str(author), author.id, ctx.message.content)
 
     async def log_command_completion(self, ctx: commands.Context):
         """
@@ -320,20 +383,24 @@ class Bot(commands.AutoShardedBot):
         .. deprecated:: 0.4
         """
 
-        if ctx.interaction or not config.log.commands:
+        if ctx.interaction or not config.log.commands or not _log.isEnabledFor(logging.INFO):
             return
 
-        rep = None
+        author = ctx.author
         message_log_infos = [
-            f"{ctx.command.name!r} command succeeded for {str(ctx.author)!r}"
-            f" ({ctx.author.id!r})"]
-
-        async for message in ctx.history(limit=5):
-            if (message.author == ctx.me
-                    and message.reference
-                    and message.reference.message_id == ctx.message.id):
-                rep = message
-                break
+            f"{ctx.command.name!r} command succeeded for {str(author)!r}"
+            f" ({author.id!r})"]
+
+        # replies sent through the context are already known, the history is only
+        # fetched for replies sent by other means. Like the tracked one, the newest reply is kept
+        rep = getattr(ctx, 'last_reply', None)
+        if rep is None:
+            async for message in ctx.history(limit=5, after=ctx.message, oldest_first=False):
+                if (message.author.id == ctx.me.id
+                        and message.reference
+                        and message.reference.message_id == ctx.message.id):
+                    rep = message
+                    break
 
         if rep:
             message_log_infos.append("with a response")
@@ -380,72 +447,32 @@ class Bot(commands.AutoShardedBot):
         if isinstance(error, commands.HybridCommandError):
             error = error.original
 
-        if isinstance(error, (commands.ConversionError, commands.BadArgument)):
-            await fallback_reply(ctx, t(
-                "command_error.bad_argument",
-                command_usage=get_command_usage(self.command_prefix, ctx.command),
-                help_command=self.command_prefix + "help " + ctx.command.name))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for"
-                f" {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"Bad arguments given")
-        elif isinstance(error, commands.MissingRequiredArgument):
-            await fallback_reply(ctx, t(
-                "command_error.missing_argument",
-                command_usage=get_command_usage(self.command_prefix, ctx.command),
-                help_command=self.command_prefix + "help " + ctx.command.name))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"Missing required argument")
-        elif (isinstance(error, commands.CommandInvokeError) and isinstance(error.original, discord.Forbidden)) or \
-                isinstance(error, commands.BotMissingPermissions):
-            await fallback_reply(ctx, t("command_error.bot_missing_permission"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"Bot is missing permissions")
-        elif isinstance(error, commands.CommandInvokeError) and isinstance(error.original, discord.NotFound):
-            await fallback_reply(ctx, t("command_error.not_found"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"No matches for the request")
-        elif isinstance(error, (commands.NotOwner, commands.MissingPermissions)):
-            await fallback_reply(ctx, t("command_error.user_missing_permission"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"User is missing permissions")
-        elif isinstance(error, commands.CommandOnCooldown):
-            await fallback_reply(
-                ctx, t(
-                    "command_error.on_cooldown",
-                    cooldown_time="<t:" + str(int(time.time() + error.retry_after)) + ":R>"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"On cooldown")
-        elif isinstance(error, (commands.InvalidEndOfQuotedStringError, commands.ExpectedClosingQuoteError)):
-            await fallback_reply(ctx, t("command_error.invalid_quoted_string"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"Invalid quoted string")
-        elif isinstance(error, commands.PrivateMessageOnly):
-            await fallback_reply(ctx, t("command_error.private_message_only"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"Private message only")
-        elif isinstance(error, commands.NoPrivateMessage):
-            await fallback_reply(ctx, t("command_error.no_private_message"))
-            _log.warning(
-                f"{ctx.command.name!r} command failed for {str(ctx.author)!r} ({ctx.author.id!r}): "
-                f"No private message")
-        elif isinstance(error, commands.CommandNotFound):
+        if isinstance(error, commands.CommandNotFound):
             return
-        elif (isinstance(error, commands.CommandInvokeError)
-              or isinstance(error, discord.app_commands.CommandInvokeError)):
+
+        if isinstance(error, commands.CommandInvokeError):
+            handler = _find_error_handler(_INVOKE_ERROR_HANDLERS, error.original)
+            if handler is None:
+                await log_command_error(self, ctx, error.original, logger=_log)
+                return
+        elif isinstance(error, discord.app_commands.CommandInvokeError):
             await log_command_error(self, ctx, error.original, logger=_log)
+            return
         else:
-            _log.error(
-                f"Unhandled command error{' on command ' + ctx.command.name if ctx.command else ''}\n"
-                + "\n".join(f'\t{key!r}: {value!r}' for key, value in ctx.__dict__.items()),
-                exc_info=error)
+            handler = _find_error_handler(_ERROR_HANDLERS, error)
+            if handler is None:
+                if _log.isEnabledFor(logging.ERROR):
+                    _log.error(
+                        "Unhandled command error%s\n%s",
+                        ' on command ' + ctx.command.name if ctx.command else '',
+                        "\n".join([f'\t{key!r}: {value!r}' for key, value in ctx.__dict__.items()]),
+                        exc_info=error)
+                return
+
+        key, reason, get_kwargs = handler
+        await fallback_reply(ctx, t(key, **(get_kwargs(self, ctx, error) if get_kwargs else {})))
+        author = ctx.author
+        _log.warning("%r command failed for %r (%r): %s", ctx.command.name, str(author), author.id, reason)
 
     async def on_error(self, event, *args, **kwargs):
         await log_data(
@@ -471,12 +498,13 @@ class Bot(commands.AutoShardedBot):
         .. deprecated:: 0.4
         """
 
-        if not config.log.commands:
+        if not config.log.commands or not _log.isEnabledFor(logging.INFO):
             return
 
+        user = i.user
         message_log_infos = [
             f"{command.qualified_name!r} app command succeeded for "
-            f"{str(i.user)!r} ({i.user.id!r})"]
+            f"{str(user)!r} ({user.id!r})"]
 
         try:
             rep: discord.InteractionMessage = await i.original_response()
@@ -513,10 +541,11 @@ class Bot(commands.AutoShardedBot):
         .. deprecated:: 0.4
         """
 
-        if not config.log.commands:
+        if not config.log.commands or not _log.isEnabledFor(logging.INFO):
             return
 
         args = await i.command._transform_arguments(i, i._cs_namespace)
+        user = i.user
         _log.info(
-            f"{i.command.name!r} app command request sent by {str(i.user)!r} "
-            f"({i.user.id!r}) with invocation \"{args!r}\"")
+            "%r app command request sent by %r (%r) with invocation \"%r\"",
+            i.command.name, str(user), user.id, args)
@@ -8,13 +8,13 @@ from discord.ext import commands
 from discord.ext.commands.parameters import Parameter, Signature
 from discord.ext.commands.core import get_signature_parameters, Command
 
+import asyncio
 import itertools
-import copy
 import functools
 from typing import Any, Dict, Generator, Callable, List, Optional, Union, Iterable
-from i18n import t
+import i18n
 
-from .utils import config, fallback_reply, set_embed_footer
+from .utils import config, fallback_reply, set_embed_footer, translate as t, _memoize_per_command
 
 
 __all__ = ('EmbedHelpCommand', 'HelpHybridCommand')
@@ -28,6 +28,7 @@ __all__ = ('EmbedHelpCommand', 'HelpHybridCommand')
 CommandTextApp = Union[commands.Command, app_commands.Command, app_commands.Group]
 
 
+@_memoize_per_command
 def get_app_signature(command: app_commands.Command) -> str:
     """To retrieve app command signature similar to :attr:`~discord.ext.commands.Command.signature`.
 
@@ -73,21 +74,38 @@ def get_app_signature(command: app_commands.Command) -> str:
     return ' '.join(result)
 
 
+@_memoize_per_command
+def _get_text_signature(command: commands.Command) -> str:
+    # Command.signature is rebuilt from the parameters on each access
+    return command.signature
+
+
+def _get_unbound_app_commands(
+        tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> List[app_commands.Command]:
+    # the app commands of the tree that don't belong to a cog
+    return [c for c in tree.get_commands(guild=guild)
+            if isinstance(c, app_commands.Command) and c.binding is None]
+
+
 class _InjectorCallback:
     # This class is to ensure that the help command instance gets passed properly
     # The final level of invocation will always leads back to the _original instance
     # hence bind needed to be modified before invoke is called.
     def __init__(self, original_callback, bind):
         self.callback = original_callback
+        self._func = original_callback.__func__
         self.bind = bind
+        # the original callback never changes, so its signature only needs to be introspected once
+        self.signature = Signature(list(Signature.from_callable(original_callback).parameters.values()))
 
     async def invoke(self, *args, **kwargs):
         # don't put cog in command_callback
         # it used to be that i could do this in parse_arguments, but appcommand extracts __self__ directly from callback
-        if self.bind.cog is not None:
+        bind = self.bind
+        if bind.cog is not None:
             cog, *args = args
 
-        return await self.callback.__func__(self.bind, *args, **kwargs)
+        return await self._func(bind, *args, **kwargs)
 
 
 def _method_partial(inject):
@@ -101,16 +119,14 @@ def _method_partial(inject):
         inject.__original_callback__ = _InjectorCallback(inject.command_callback, inject)
 
     invoker = inject.__original_callback__
-    original_callback = invoker.callback
 
-    async def invoke(*args, **kwargs):  # allows __signature__ modification
+    # a new function is defined on each call, so its __signature__ can be set directly
+    async def callback(*args, **kwargs):  # allows __signature__ modification
         return await invoker.invoke(*args, **kwargs)
 
-    callback = copy.copy(invoke)
     # retrieve original signature so the user can modify if they want.
     # also good for AppCommand compatibility
-    original_signature = Signature.from_callable(original_callback).parameters.values()
-    callback.__signature__ = Signature.from_callable(callback).replace(parameters=original_signature)
+    callback.__signature__ = invoker.signature
     inject.command_callback = callback
     return callback
 
@@ -122,17 +138,28 @@ class _HelpHybridCommandImpl(commands.HybridCommand):
         super().__init__(inject.command_callback, *args, **kwargs)
         self._original: commands.HelpCommand = inject
         self._injected: commands.HelpCommand = inject
-        self.params: Dict[str, Parameter] = get_signature_parameters(
-            inject.__original_callback__.callback, globals(), skip_parameters=1  # type: ignore
-        )
+        self._cached_callback: Optional[Callable[..., Any]] = None
+        self._cached_params: Dict[str, Parameter] = {}
+        self.params: Dict[str, Parameter] = self._get_params()
+        self._guild_ids_set: frozenset = frozenset(getattr(self.app_command, '_guild_ids', None) or ())
+        # the app command mappings per guild, and the tree state they were built for
+        self._app_mapping_key: Optional[tuple] = None
+        self._app_mapping_cache: Optional[dict] = None
+
+    def _get_params(self) -> Dict[str, Parameter]:
+        # the parameters only depend on the original callback, which never changes
+        # between invocations, so they are only computed again if it gets replaced
+        callback = self._original.__original_callback__.callback  # type: ignore
+        if self._cached_callback is not callback:
+            self._cached_params = get_signature_parameters(callback, globals(), skip_parameters=1)
+            self._cached_callback = callback
+        return self._cached_params.copy()
 
     async def prepare(self, ctx: commands.Context) -> None:
         self._injected = injected = self._original.copy()
         injected.context = ctx
         self._original.__original_callback__.bind = injected  # type: ignore
-        self.params = get_signature_parameters(
-            self._original.__original_callback__.callback, globals(), skip_parameters=1  # type: ignore
-        )
+        self.params = self._get_params()
 
         on_error = injected.on_help_command_error
         if not hasattr(on_error, '__help_command_not_overridden__'):
@@ -238,8 +265,10 @@ class HelpHybridCommand(commands.HelpCommand):
             mapping = self.get_bot_mapping()
             if self.include_apps:
                 app_mapping = self.get_bot_app_mapping()
-                for cog, app_cmds in app_mapping.items():
-                    mapping.setdefault(cog, []).extend(app_cmds)
+                mapping = {
+                    cog: mapping.get(cog, []) + app_mapping.get(cog, [])
+                    for cog in itertools.chain(mapping, (c for c in app_mapping if c not in mapping))
+                }
 
             return await self.send_bot_help(mapping)
 
@@ -257,12 +286,11 @@ class HelpHybridCommand(commands.HelpCommand):
         keys = command.split(' ')
         base_cmd = keys[0]
         cmd = bot.all_commands.get(base_cmd)
-        if self.include_apps:
-            guild_id = getattr(ctx.guild, "id", None)
-            guild_based = guild_id in (getattr(self._command_impl.app_command, '_guild_ids', None) or [])
-            if cmd is None:
-                if guild_based:
-                    cmd = bot.tree.get_command(base_cmd, guild=discord.Object(guild_id))
+        include_apps = self.include_apps
+        if include_apps and cmd is None:
+            guild = ctx.guild
+            if guild is not None and guild.id in self._command_impl._guild_ids_set:
+                cmd = bot.tree.get_command(base_cmd, guild=guild)
 
             if cmd is None:
                 cmd = bot.tree.get_command(base_cmd)
@@ -273,7 +301,7 @@ class HelpHybridCommand(commands.HelpCommand):
 
         for key in keys[1:]:
             try:
-                d = (getattr(cmd, 'all_commands', None) or cmd._children) if self.include_apps else cmd.all_commands  # type: ignore
+                d = (getattr(cmd, 'all_commands', None) or cmd._children) if include_apps else cmd.all_commands  # type: ignore
                 found = d.get(key)  # type: ignore
             except AttributeError:
                 string = await maybe_coro(self.subcommand_not_found, cmd, self.remove_mentions(key))
@@ -366,7 +394,7 @@ class HelpHybridCommand(commands.HelpCommand):
         if sort and key is None:
             key = lambda c: c.name
 
-        iterator = commands if self.show_hidden else filter(lambda c: not getattr(c, 'hidden', None), commands)
+        iterator = commands if self.show_hidden else (c for c in commands if not getattr(c, 'hidden', False))
 
         if self.verify_checks is False:
             # if we do not need to verify the checks then we can just
@@ -407,9 +435,14 @@ class HelpHybridCommand(commands.HelpCommand):
             except app_commands.AppCommandError:
                 return False
 
+        # the text command checks swap ctx.command while they run, so they must run one
+        # after the other, but the app command ones only use the interaction and may each
+        # hit the API, so they are run concurrently
+        cmds = list(iterator)
+        app_results = iter(await asyncio.gather(*(predicate(cmd) for cmd in cmds if not isinstance(cmd, Command))))
         ret = []
-        for cmd in iterator:
-            valid = await predicate(cmd)
+        for cmd in cmds:
+            valid = await predicate(cmd) if isinstance(cmd, Command) else next(app_results)
             if valid:
                 ret.append(cmd)
 
@@ -432,7 +465,7 @@ class HelpHybridCommand(commands.HelpCommand):
         """
 
         if isinstance(command, commands.Command):
-            signature = command.signature
+            signature = _get_text_signature(command)
         elif not isinstance(command, app_commands.Group):
             signature = get_app_signature(command)
         else:
@@ -499,23 +532,34 @@ class HelpHybridCommand(commands.HelpCommand):
         """
         ctx = self.context
         bot = ctx.bot
+
+        # the guild independent part of the mapping only changes when cogs or app commands
+        # are added or removed, so it is cached until then when the tree keeps track of it
+        generation = getattr(bot.tree, 'generation', None)
+        if generation is None:
+            mapping = self._build_global_app_mapping()
+        else:
+            key = (generation, tuple(map(id, bot.cogs.values())))
+            impl = self._command_impl
+            if impl._app_mapping_key != key or impl._app_mapping_cache is None:
+                impl._app_mapping_key = key
+                impl._app_mapping_cache = self._build_global_app_mapping()
+            mapping = impl._app_mapping_cache
+
+        mapping = {cog: list(cmds) for cog, cmds in mapping.items()}
+        if ctx.guild is not None:
+            mapping[None][:0] = _get_unbound_app_commands(bot.tree, ctx.guild)
+        return mapping
+
+    def _build_global_app_mapping(self) -> Dict[Optional[commands.Cog], List[Union[app_commands.Command, app_commands.Group]]]:
+        bot = self.context.bot
         mapping = {}
 
         for cog in bot.cogs.values():
             cmds = cog.get_app_commands() if not isinstance(cog, commands.GroupCog) else cog.app_command.commands
             mapping.setdefault(cog, []).extend(cmds)
 
-        def get_cmds(with_guild=None):
-            return [c for c in bot.tree.get_commands(guild=with_guild)
-                    if isinstance(c, app_commands.Command) and c.binding is None]
-
-        guild = ctx.guild
-        mapping[None] = []
-        if guild is not None:
-            mapping[None].extend(get_cmds(guild))
-
-        mapping[None].extend(get_cmds())
-
+        mapping[None] = _get_unbound_app_commands(bot.tree)
         return mapping
 
     def get_destination(self) -> discord.abc.Messageable:
@@ -561,25 +605,30 @@ class EmbedHelpCommand(HelpHybridCommand):
         ctx = self.context
         bot = ctx.bot
 
-        def get_category(command):
+        no_category = t("help.bot.no_category")
+
+        filtered = await self.filter_commands(bot.commands)
+        categories = {}
+        for command in filtered:
             cog = command.cog
-            return cog.qualified_name if cog is not None else t("help.bot.no_category")
+            category = cog.qualified_name if cog is not None else no_category
+            categories.setdefault(category, []).append(command.name)
 
-        filtered = await self.filter_commands(bot.commands, sort=True, key=get_category)
-        to_iterate = itertools.groupby(filtered, key=get_category)
+        description = []
+        if bot.description:
+            description += [bot.description, "\n\n"]
+        description.append(t("help.bot.description", help_command=self.context.clean_prefix + self.invoked_with))
 
         e = discord.Embed(
             title=t("help.bot.title"),
-            description=(
-                ((bot.description + "\n\n") if bot.description else "") +
-                t("help.bot.description", help_command=self.context.clean_prefix + self.invoked_with))
+            description="".join(description)
         )
 
-        for category, commands in to_iterate:
+        for category, names in sorted(categories.items()):
             e.add_field(
                 name=category,
-                value=("`" + "`, `".join(elem.name for elem in commands) + "`")
-                if commands else t("help.no_commands"),
+                value=f"`{'`, `'.join(names)}`"
+                if names else t("help.no_commands"),
                 inline=False
             )
 
@@ -605,7 +654,7 @@ class EmbedHelpCommand(HelpHybridCommand):
 
         e.add_field(
             name=t("help.cog.commands"),
-            value=("`" + "`, `".join(elem.name for elem in filtered) + "`")
+            value=f"`{'`, `'.join([elem.name for elem in filtered])}`"
             if filtered else t("help.no_commands"),
             inline=False
         )
@@ -623,13 +672,16 @@ class EmbedHelpCommand(HelpHybridCommand):
 
         ctx = self.context
 
+        description = []
+        if command.description:
+            description += [command.description, "\n\n"]
+        description += ["```", self.get_command_signature(command), "```"]
+        if command.help:
+            description += ["\n", command.help]
+
         e = discord.Embed(
             title=t("help.command.title", command=command.name),
-            description=(
-                    (command.description + "\n\n" if command.description else "") +
-                    f"```{self.get_command_signature(command)}```" +
-                    ("\n" + command.help if command.help else "")
-            )
+            description="".join(description)
         )
 
         set_embed_footer(self.context.bot, e)
@@ -654,7 +706,7 @@ class EmbedHelpCommand(HelpHybridCommand):
 
         e.add_field(
             name=t("help.group.title", group=group.qualified_name),
-            value=("`" + "`, `".join(elem.name for elem in filtered) + "`")
+            value=f"`{'`, `'.join([elem.name for elem in filtered])}`"
             if filtered else t("help.no_commands"),
             inline=False
         )
@@ -670,7 +722,8 @@ class EmbedHelpCommand(HelpHybridCommand):
         :return: the message to send
         """
 
-        return t("help.command.not_found", command=command_name)
+        # formatted with user input, so not memoized
+        return i18n.t("help.command.not_found", command=command_name)
 
     async def subcommand_not_found(self, command, subcommand_name):
         """
@@ -681,10 +734,9 @@ class EmbedHelpCommand(HelpHybridCommand):
         :return: the message to send
         """
 
-        ctx = self.context
-
         if isinstance(command, commands.Group) and len(command.all_commands) > 0:
-            return t("help.subcommand.not_found", command=command.qualified_name, subcommand=subcommand_name)
+            return i18n.t(
+                "help.subcommand.not_found", command=command.qualified_name, subcommand=subcommand_name)
         return t("help.subcommand.no_subcommand", command=command.qualified_name)
 
     async def send_error_message(self, error: commands.CommandError):
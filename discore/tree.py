@@ -4,6 +4,7 @@ The class that represent the bot's command tree
 
 import logging
 import time
+from typing import Union
 
 from i18n import t
 
@@ -12,19 +13,86 @@ from discord import app_commands
 from discord._types import ClientT
 from discord.app_commands import Namespace, AppCommandError
 
-from .utils import get_app_command_usage, log_command_error, set_locale
+from .utils import get_app_command_usage, log_command_error, set_locale, _find_error_handler
 
 __all__ = ('CommandTree',)
 
 _log = logging.getLogger(__name__)
 
 
+def _transformer_kwargs(interaction: Interaction, error: app_commands.TransformerError) -> dict:
+    command = interaction.command
+    return {
+        "argument_value": error.value,
+        "command_usage": get_app_command_usage(command) if command is not None else '',
+        "help_command": "/help " + (command.qualified_name if command else ''),
+    }
+
+
+def _missing_role_kwargs(interaction: Interaction, error: app_commands.MissingRole) -> dict:
+    return {"role": error.missing_role}
+
+
+def _missing_any_role_kwargs(interaction: Interaction, error: app_commands.MissingAnyRole) -> dict:
+    return {"roles_list": ", ".join(error.missing_roles)}
+
+
+def _missing_permissions_kwargs(
+        interaction: Interaction,
+        error: Union[app_commands.MissingPermissions, app_commands.BotMissingPermissions]) -> dict:
+    return {"permissions_list": ", ".join(error.missing_permissions)}
+
+
+def _cooldown_kwargs(interaction: Interaction, error: app_commands.CommandOnCooldown) -> dict:
+    return {"cooldown_time": "<t:" + str(int(time.time() + error.retry_after)) + ":R>"}
+
+
+# Map the handled app command errors to the translation key of the reply
+# and the function giving the translation arguments, if any
+_ERROR_HANDLERS = {
+    app_commands.TransformerError: ('app_error.transformer', _transformer_kwargs),
+    app_commands.NoPrivateMessage: ('app_error.no_private_message', None),
+    app_commands.MissingRole: ('app_error.missing_role', _missing_role_kwargs),
+    app_commands.MissingAnyRole: ('app_error.missing_any_role', _missing_any_role_kwargs),
+    app_commands.MissingPermissions: ('app_error.missing_permissions', _missing_permissions_kwargs),
+    app_commands.BotMissingPermissions: ('app_error.bot_missing_permissions', _missing_permissions_kwargs),
+    app_commands.CommandOnCooldown: ('app_error.on_cooldown', _cooldown_kwargs),
+}
+
+
+# The public attributes of an interaction, dumped when an unhandled error occurs
+_INTERACTION_ATTRIBUTES = tuple(attr for attr in Interaction.__slots__ if attr[0] != '_')
+
+
 class CommandTree(app_commands.CommandTree):
     """
     A class that represents the bot's command tree.
     """
     def __init__(self, bot):
         super().__init__(bot)
+        # incremented each time the registered commands change, to invalidate dependant caches
+        self.generation: int = 0
+
+    def add_command(self, *args, **kwargs) -> None:
+        super().add_command(*args, **kwargs)
+        self.generation += 1
+
+    def remove_command(self, *args, **kwargs):
+        self.generation += 1
+        return super().remove_command(*args, **kwargs)
+
+    def clear_commands(self, *args, **kwargs) -> None:
+        super().clear_commands(*args, **kwargs)
+        self.generation += 1
+
+    def copy_global_to(self, *args, **kwargs) -> None:
+        super().copy_global_to(*args, **kwargs)
+        self.generation += 1
+
+    def _remove_with_module(self, *args, **kwargs) -> None:
+        # used by unload_extension, which doesn't go through remove_command
+        super()._remove_with_module(*args, **kwargs)
+        self.generation += 1
 
     async def on_error(
             self, interaction: Interaction, error: app_commands.AppCommandError) -> None:
@@ -65,47 +133,29 @@ class CommandTree(app_commands.CommandTree):
 
         command = interaction.command
 
-        if isinstance(error, app_commands.TransformerError):
-            await interaction.response.send_message(t(
-                'app_error.transformer',
-                argument_value=error.value,
-                command_usage=(get_app_command_usage(command) if command is not None else ''),
-                help_command="/help " + (command.qualified_name if command else '')), ephemeral=True)
-        elif isinstance(error, app_commands.NoPrivateMessage):
-            await interaction.response.send_message(
-                t('app_error.no_private_message'), ephemeral=True)
-        elif isinstance(error, app_commands.MissingRole):
-            await interaction.response.send_message(t(
-                'app_error.missing_role',
-                role=error.missing_role), ephemeral=True)
-        elif isinstance(error, app_commands.MissingAnyRole):
-            await interaction.response.send_message(t(
-                'app_error.missing_any_role',
-                roles_list=", ".join(error.missing_roles)), ephemeral=True)
-        elif isinstance(error, app_commands.MissingPermissions):
-            await interaction.response.send_message(t(
-                'app_error.missing_permissions',
-                permissions_list=", ".join(error.missing_permissions)), ephemeral=True)
-        elif isinstance(error, app_commands.BotMissingPermissions):
-            await interaction.response.send_message(t(
-                'app_error.bot_missing_permissions',
-                permissions_list=", ".join(error.missing_permissions)), ephemeral=True)
-        elif isinstance(error, app_commands.CommandOnCooldown):
-            await interaction.response.send_message(t(
-                'app_error.on_cooldown',
-                cooldown_time="<t:" + str(int(time.time() + error.retry_after)) + ":R>", ephemeral=True))
-        elif isinstance(error, app_commands.CommandNotFound):
+        if isinstance(error, app_commands.CommandNotFound):
             await self.sync(guild=interaction.guild)
             await interaction.response.send_message(
                 t('app_error.command_not_found'), ephemeral=True)
-        elif isinstance(error, app_commands.CommandInvokeError):
+            return
+
+        if isinstance(error, app_commands.CommandInvokeError):
             await log_command_error(self.client, interaction, error.original, logger=_log)
-        else:
-            _log.error(
-                f"Unhandled command error{' on command ' + command.qualified_name if command else ''}\n"
-                + "\n".join(f'\t{attr!r}: {interaction.__getattribute__(attr)!r}' for attr in interaction.__slots__
-                            if attr[0] != '_'),
-                exc_info=error)
+            return
+
+        handler = _find_error_handler(_ERROR_HANDLERS, error)
+        if handler is None:
+            if _log.isEnabledFor(logging.ERROR):
+                _log.error(
+                    "Unhandled command error%s\n%s",
+                    ' on command ' + command.qualified_name if command else '',
+                    "\n".join([f'\t{attr!r}: {getattr(interaction, attr)!r}' for attr in _INTERACTION_ATTRIBUTES]),
+                    exc_info=error)
+            return
+
+        key, get_kwargs = handler
+        await interaction.response.send_message(
+            t(key, **(get_kwargs(interaction, error) if get_kwargs else {})), ephemeral=True)
 
     async def _call(self, interaction: Interaction[ClientT]) -> None:
         if not await self.interaction_check(interaction):
@@ -1,15 +1,25 @@
+import asyncio
+import re
 import string
-from typing import Union, Optional, Iterable
-import yamlenv
+import functools
+from typing import Union, Optional, Iterable, Callable
+import yaml
 import addict
 import i18n
 from os import path
 import os
 import datetime as dt
 import sys
+import time
 import traceback as tb
-from dotenv import load_dotenv
+import types
+import weakref
 import logging
+import logging.handlers
+import atexit
+import copy
+import queue
+import threading
 
 import discord
 from discord.ext import commands
@@ -24,6 +34,8 @@ __all__ = (
     'logging_init',
     'i18n_init',
     'set_locale',
+    'translate',
+    'clear_translation_cache',
     'fallback_reply',
     'get_command_usage',
     'get_app_command_usage',
@@ -40,6 +52,9 @@ class SparseFormatter(string.Formatter):
     args/kwargs.
     """
 
+    def parse(self, format_string):
+        return _parse_format_string(format_string)
+
     # re-implemented this method for python2/3 compatibility
     def vformat(self, format_string, args, kwargs):
         used_args = set()
@@ -51,6 +66,9 @@ class SparseFormatter(string.Formatter):
                  auto_arg_index=0):
         if recursion_depth < 0:
             raise ValueError('Max string recursion exceeded')
+        # no field to format, which includes the empty format specs
+        if '{' not in format_string and '}' not in format_string:
+            return format_string, auto_arg_index
         result = []
         for literal_text, field_name, format_spec, conversion in \
                 self.parse(format_string):
@@ -116,6 +134,19 @@ class SparseFormatter(string.Formatter):
         return ''.join(result), auto_arg_index
 
 
+# The plain formatter parsing the format strings for the sparse one
+_base_formatter = string.Formatter()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_format_string(format_string: str) -> tuple:
+    """
+    Parse a format string once, as the same ones are formatted over and over
+    """
+
+    return tuple(_base_formatter.parse(format_string))
+
+
 def sformat(s, *args, **kwargs):
     """
     Sparse format a string.
@@ -141,11 +172,46 @@ def sformat(s, *args, **kwargs):
     -------
     str
     """
-    return SparseFormatter().format(s, *args, **kwargs)
+    if not args:
+        # when each brace belongs to a plain named field, the fields are formatted one by one
+        fields = _NAMED_FIELD_RE.findall(s)
+        if len(fields) == s.count('{') == s.count('}'):
+            return _NAMED_FIELD_RE.sub(functools.partial(_format_named_field, kwargs), s)
+    return _sparse_formatter.format(s, *args, **kwargs)
+
+
+# SparseFormatter doesn't hold any state, so a single instance is shared
+_sparse_formatter = SparseFormatter()
+
+
+# A replacement field referring to a keyword argument, without any nested field
+_NAMED_FIELD_RE = re.compile(r'\{[A-Za-z_][^{}]*\}')
+
+
+def _format_named_field(kwargs: dict, match: re.Match) -> str:
+    field = match.group()
+    try:
+        return field.format_map(kwargs)
+    except (IndexError, KeyError):
+        # rebuilt like SparseFormatter does, which drops empty conversions and format specs
+        (_, field_name, format_spec, conversion), = _parse_format_string(field)
+        if conversion:
+            field_name += '!' + conversion
+        if format_spec:
+            field_name += ':' + format_spec
+        return '{' + field_name + '}'
 
 
 config: addict.Dict = addict.Dict(loaded=False)
 
+_DEFAULT_CONFIG_PATH = path.join(path.dirname(__file__), "default_config.yml")
+_PACKAGE_LOCALES_PATH = path.join(path.dirname(__file__), "locales")
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _YamlLoader = yaml.SafeLoader
+
 
 def config_init(**kwargs):
     """
@@ -154,14 +220,17 @@ def config_init(**kwargs):
 
     env_file = kwargs.pop('env_file', '.env')
     if env_file:
+        from dotenv import load_dotenv
         load_dotenv(dotenv_path=env_file)
 
-    config_files = [path.join(path.dirname(__file__), "default_config.yml")]
+    load_config(_load_default_config())
+
+    config_files = []
 
-    if "config.yml" in os.listdir() and os.path.isfile("config.yml"):
+    if os.path.isfile("config.yml"):
         config_files.append("config.yml")
 
-    if "override.config.yml" in os.listdir() and os.path.isfile("override.config.yml"):
+    if os.path.isfile("override.config.yml"):
         config_files.append("override.config.yml")
 
     if 'configuration_file' in kwargs:
@@ -179,8 +248,7 @@ def config_init(**kwargs):
             config_files.append(env_config)
 
     for config_file in config_files:
-        with open(config_file, encoding='utf-8') as f:
-            load_config(yamlenv.load(f))
+        load_config(_load_config_file(config_file))
 
     if 'configuration' in kwargs:
         load_config(kwargs.pop('configuration'))
@@ -188,6 +256,17 @@ def config_init(**kwargs):
     config.loaded = True
 
 
+@functools.lru_cache(maxsize=None)
+def _load_default_config() -> dict:
+    """
+    Parse the default configuration shipped with the package, only once per process.
+    It doesn't reference any environment variable, so the libyaml loader is used directly
+    """
+
+    with open(_DEFAULT_CONFIG_PATH, encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_config(configuration: dict, recursion_key: str = "override_config"):
     """
     Load a configuration given a dictionary
@@ -200,9 +279,29 @@ def load_config(configuration: dict, recursion_key: str = "override_config"):
     if not recursion_key or recursion_key not in config:
         return
 
-    override = config.pop(recursion_key)
-    with open(override, encoding='utf-8') as f:
-        load_config(yamlenv.load(f))
+    load_config(_load_config_file(config.pop(recursion_key)))
+
+
+def _load_config_file(file_path: str) -> dict:
+    """
+    Load a configuration file, reusing the previous parsing if neither the file
+    nor the environment variables it may reference changed since then
+
+    :param file_path: The path of the configuration file
+    :return: The parsed configuration
+    """
+
+    stat = os.stat(file_path)
+    return _parse_config_file(
+        path.abspath(file_path), stat.st_mtime_ns, stat.st_size, frozenset(os.environ.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(file_path: str, mtime: int, size: int, environment: frozenset) -> dict:
+    import yamlenv
+
+    with open(file_path, encoding='utf-8') as f:
+        return yamlenv.load(f)
 
 
 _ainsi = {
@@ -264,6 +363,44 @@ _ainsi = {
     "reset": "\x1b[0m"
 }
 
+# The ANSI codes replaced by nothing, for uncolored outputs
+_stripped_ainsi = dict.fromkeys(_ainsi, "")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_level_format(log_format: str, level_format: str, color: bool) -> str:
+    """
+    Get the log format of a level, with its ANSI codes resolved (or removed if not colored)
+
+    :param log_format: The log format, containing the `levelformat` field
+    :param level_format: The format of the level
+    :param color: Whether to keep the colors
+    :return: The resolved format
+    """
+
+    ainsi = _ainsi if color else _stripped_ainsi
+    return sformat(sformat(log_format, levelformat=level_format), **ainsi)
+
+
+class _LevelFormatter(logging.Formatter):
+    """
+    A formatter memoizing the date of the last formatted second, as records often come in bursts
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time = (None, None)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:  # the default format includes the milliseconds
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, last_time = self._last_time
+        if second != last_second:
+            last_time = super().formatTime(record, datefmt)
+            self._last_time = (second, last_time)
+        return last_time
+
 
 class Formatter(logging.Formatter):
 
@@ -271,22 +408,24 @@ class Formatter(logging.Formatter):
         super().__init__(*args, **kwargs)
         self.color = color
 
-        ainsi = _ainsi if color else {k: "" for k in _ainsi}
-
+        log_format, date_format = config.log.format, config.log.date_format
         self.formatters = {
-            level: logging.Formatter(
-                sformat(
-                    sformat(config.log.format, levelformat=text_format),
-                    **ainsi),
-                config.log.date_format,
+            level: _LevelFormatter(
+                _get_level_format(log_format, text_format, color),
+                date_format,
                 style='{'
             )
             for level, text_format in config.log.level_format.items()
         }
+        # the formatters indexed by level number, to avoid lowering the level name of each record
+        self._formatters_by_level = {
+            logging.getLevelName(level.upper()): formatter
+            for level, formatter in self.formatters.items()
+        }
+        self._default_formatter = self.formatters['debug']
 
     def format(self, record: logging.LogRecord) -> str:
-        formatter = self.formatters.get(
-            record.levelname.lower(), self.formatters['debug'])
+        formatter = self._formatters_by_level.get(record.levelno, self._default_formatter)
 
         # Override the traceback to always print in red
         if record.exc_info and self.color:
@@ -300,12 +439,57 @@ class Formatter(logging.Formatter):
         return output
 
 
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    A queue handler leaving all the formatting, including the traceback, to the listener's handlers
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    A memory handler also writing its records once the oldest one has been held for
+    a given time, so that they don't stay in memory indefinitely on a quiet bot
+    """
+
+    def __init__(self, capacity: int, flush_interval: Optional[float], **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if not self.flush_interval:
+            return
+        with self.lock:
+            if self.buffer and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            super().flush()
+
+
 def logging_init(**kwargs) -> None:
     """
     Initialize the logging system
 
     :return: None
     """
+    global _logging_listener
+
+    _reset_logging()
+
     log_level = kwargs.pop("log_level", config.log.level)
     given_formatter = kwargs.pop("formatter", None)
 
@@ -314,7 +498,7 @@ def logging_init(**kwargs) -> None:
     log_stream = kwargs.pop("log_stream", config.log.stream)
     if log_stream:
         stream = kwargs.pop("stream", sys.stderr if config.log.stream_to_err else sys.stdout)
-        stream_handler = kwargs.pop("log_handler", logging.StreamHandler(stream))
+        stream_handler = kwargs.pop("log_handler", None) or logging.StreamHandler(stream)
         stream_formatter = given_formatter or Formatter()
         stream_handler.setFormatter(stream_formatter)
         handlers.append(stream_handler)
@@ -325,8 +509,26 @@ def logging_init(**kwargs) -> None:
         file_formatter = given_formatter or Formatter(color=False)
         file_handler.setFormatter(file_formatter)
 
+        file_buffer = kwargs.pop("log_file_buffer", config.log.file_buffer)
+        if file_buffer:
+            # records are written by batches, but errors are always written right away
+            file_handler = _TimedMemoryHandler(
+                file_buffer,
+                kwargs.pop("log_file_flush_interval", config.log.file_flush_interval),
+                flushLevel=logging.ERROR, target=file_handler)
+
         handlers.append(file_handler)
 
+    if handlers:
+        # the records are formatted, tracebacks included, and written from a separate
+        # thread, so that neither the formatting nor the writes block the event loop
+        log_queue = queue.SimpleQueue()
+        _logging_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _logging_listener.start()
+        atexit.register(_logging_listener.stop)
+
+        handlers = [_QueueHandler(log_queue)]
+
     root_logger = kwargs.pop("root_logger", config.log.root)
     if root_logger:
         loggers = (logging.getLogger(),)
@@ -336,9 +538,38 @@ def logging_init(**kwargs) -> None:
     for logger in loggers:
         for handler in handlers:
             logger.addHandler(handler)
+            _logging_handlers.append((logger, handler))
         logger.setLevel(log_level)
 
 
+# The handlers added by logging_init to each logger, and the listener writing the records
+_logging_handlers: list = []
+_logging_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _reset_logging() -> None:
+    """
+    Remove the handlers set up by a previous logging_init call, so that
+    initialising the logging again doesn't output each record several times
+    """
+
+    global _logging_listener
+
+    for logger, handler in _logging_handlers:
+        logger.removeHandler(handler)
+    _logging_handlers.clear()
+
+    if _logging_listener is not None:
+        atexit.unregister(_logging_listener.stop)
+        _logging_listener.stop()
+        for handler in _logging_listener.handlers:
+            target = getattr(handler, 'target', None)  # the file handler behind a buffer
+            handler.close()
+            if target is not None:
+                target.close()
+        _logging_listener = None
+
+
 def i18n_init(**kwargs):
     """
     Initialize the i18n system
@@ -350,10 +581,12 @@ def i18n_init(**kwargs):
     i18n.set('locale', kwargs.pop('locale', config.locale))
     i18n.set('fallback', kwargs.pop('fallback', config.locale))
     i18n.set('enable_memoization', kwargs.pop('enable_memoization', not config.hot_reload))
-    i18n.load_path.append(path.join(path.dirname(__file__), 'locales'))
     locale_dir = kwargs.pop('locale_dir', 'locales')
-    if path.exists(locale_dir) and path.isdir(locale_dir):
-        i18n.load_path.append(locale_dir)
+    # the paths are only added once, as i18n walks all of them when a translation isn't loaded yet
+    i18n.load_path.extend([
+        locale_path
+        for locale_path in (_PACKAGE_LOCALES_PATH, locale_dir)
+        if locale_path not in i18n.load_path and path.isdir(locale_path)])
 
 
 def set_locale(value: Union[commands.Context, discord.Interaction, discord.Locale, str, any]) -> None:
@@ -363,16 +596,63 @@ def set_locale(value: Union[commands.Context, discord.Interaction, discord.Local
     :return: None
     """
 
-    if isinstance(value, commands.Context) and value.interaction:
-        i18n.set('locale', value.interaction.locale.value)
-    elif isinstance(value, discord.Interaction):
-        i18n.set('locale', value.locale.value)
-    elif isinstance(value, discord.Locale):
-        i18n.set('locale', value.value)
-    elif isinstance(value, str):
-        i18n.set('locale', value)
-    else:
-        i18n.set('locale', i18n.config.get('fallback'))
+    locale = _get_locale_getter(type(value))(value)
+    i18n.set('locale', locale if locale is not None else i18n.config.get('fallback'))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_locale_getter(value_type: type):
+    """
+    Get the function returning the locale of the objects of a type, or None if
+    they don't have one, so that the type is only checked once
+
+    :param value_type: The type of the objects
+    :return: The locale getter
+    """
+
+    if issubclass(value_type, commands.Context):
+        return lambda value: value.interaction.locale.value if value.interaction else None
+    if issubclass(value_type, discord.Interaction):
+        return lambda value: value.locale.value
+    if issubclass(value_type, discord.Locale):
+        return lambda value: value.value
+    if issubclass(value_type, str):
+        return lambda value: value
+    return lambda value: None
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_translation(locale: str, key: str, kwargs: tuple) -> str:
+    return i18n.t(key, locale=locale, **dict(kwargs))
+
+
+def translate(key: str, **kwargs) -> str:
+    """
+    Translate a key in the current locale, like i18n.t, but memoize the result
+    per locale and arguments when hot reload is disabled
+
+    :param key: The key of the translation
+    :param kwargs: The arguments to format the translation with
+    :return: The translated string
+    """
+
+    if config.hot_reload:
+        return i18n.t(key, **kwargs)
+    locale = kwargs.pop('locale', i18n.get('locale'))
+    try:
+        return _cached_translation(locale, key, tuple(sorted(kwargs.items())))
+    except TypeError:  # unhashable arguments
+        return i18n.t(key, locale=locale, **kwargs)
+
+
+def clear_translation_cache() -> None:
+    """
+    Clear the translations memoized by translate, e.g. after the locale files changed
+
+    :return: None
+    """
+
+    _cached_translation.cache_clear()
 
 
 async def fallback_reply(
@@ -413,6 +693,23 @@ async def fallback_reply(
         return await destination.send(*args, **kwargs)
 
 
+def _find_error_handler(handlers: dict, error: Exception) -> Optional[tuple]:
+    """
+    Find the handler of an error in a table mapping error types to handlers,
+    following the error class hierarchy
+
+    :param handlers: The handlers, per error type
+    :param error: The error to handle
+    :return: The handler of the closest error type, if any
+    """
+
+    for cls in type(error).__mro__:
+        handler = handlers.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
 def get_command_usage(prefix: str, command: commands.Command) -> str:
     """
     returns a command usage text for users
@@ -421,19 +718,49 @@ def get_command_usage(prefix: str, command: commands.Command) -> str:
     :param command: the command on which the usage should be got
     :return: the command usage
     """
+    try:
+        return _get_cached_command_usage(command, prefix)
+    except TypeError:  # unhashable prefix
+        return _get_cached_command_usage.__wrapped__(command, prefix)
+
+
+def _memoize_per_command(func: Callable) -> Callable:
+    """
+    Memoize a function whose first argument is a command, without keeping the
+    command alive once it's removed from the bot (e.g. when its cog is unloaded)
+
+    :param func: The function to memoize
+    :return: The memoized function
+    """
+
+    cache = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def wrapper(command, *args):
+        results = cache.get(command)
+        if results is None:
+            results = cache[command] = {}
+        if args not in results:
+            results[args] = func(command, *args)
+        return results[args]
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+@_memoize_per_command
+def _get_cached_command_usage(command: commands.Command, prefix: str) -> str:
     parent = command.full_parent_name
     if len(command.aliases) > 0:
         aliases = '|'.join(command.aliases)
-        fmt = f'[{command.name}|{aliases}]'
-        if parent:
-            fmt = parent + ' ' + fmt
-        alias = fmt
+        alias = f'{parent} [{command.name}|{aliases}]' if parent else f'[{command.name}|{aliases}]'
     else:
-        alias = command.name if not parent else parent + ' ' + command.name
+        alias = f'{parent} {command.name}' if parent else command.name
 
     return f'{prefix}{alias} {command.signature}'
 
 
+@_memoize_per_command
 def get_app_command_usage(command: Union[app_commands.Command, app_commands.ContextMenu]):
     """
     returns a command usage text for users
@@ -442,13 +769,10 @@ def get_app_command_usage(command: Union[app_commands.Command, app_commands.Cont
     :return: the command usage
     """
 
-    return (
-            '/'
-            + command.qualified_name
-            + ' '
-            + ' '.join(
+    params = ' '.join([
         param.display_name for param
-        in (command.parameters if isinstance(command, app_commands.Command) else [])))
+        in (command.parameters if isinstance(command, app_commands.Command) else [])])
+    return f'/{command.qualified_name} {params}'
 
 
 def sanitize(text: str, limit=4000, crop_at_end: bool = True, replace_newline: bool = True) -> str:
@@ -461,11 +785,25 @@ def sanitize(text: str, limit=4000, crop_at_end: bool = True, replace_newline: b
     :param replace_newline: Whether to replace newlines with "\\n"
     """
 
+    text_len = len(text)
+    if "```" not in text and not (replace_newline and "\n" in text):
+        # nothing to replace, the text is only cropped if needed
+        if text_len <= limit:
+            return text
+        if crop_at_end:
+            return text[:limit - 3] + "..."
+        return "..." + text[text_len - limit + 3:]
+
+    cropped = crop_at_end and text_len > limit
+    if cropped:
+        # sanitizing never shortens the text, so only the kept part needs to be processed
+        text = text[:limit]
+
     sanitized_text = text.replace("```", "'''")
     if replace_newline:
         sanitized_text = sanitized_text.replace("\n", "\\n")
     text_len = len(sanitized_text)
-    if text_len > limit:
+    if cropped or text_len > limit:
         if crop_at_end:
             return sanitized_text[:limit - 3] + "..."
         return "..." + sanitized_text[text_len - limit + 3:]
@@ -486,44 +824,78 @@ async def log_command_error(
     :return: None
     """
 
-    error_data = tb.extract_tb(err.__traceback__)[1]
-    error_filename = path.basename(error_data.filename)
+    error_tb = _get_traceback_entry(err.__traceback__, 1)
+    error_code = error_tb.tb_frame.f_code
 
     if config.log.alert_user:
         await fallback_reply(ctx_i, i18n.t(
             "command_error.exception",
-            file=error_filename,
-            line=error_data.lineno,
-            command=error_data.name,
+            file=path.basename(error_code.co_filename),
+            line=error_tb.tb_lineno,
+            command=error_code.co_name,
             error=type(err).__name__,
             error_message=err))
 
-    user = ctx_i.author if isinstance(ctx_i, commands.Context) else ctx_i.user
+    is_context = isinstance(ctx_i, commands.Context)
+    user = ctx_i.author if is_context else ctx_i.user
+    user_name = str(user)
 
     data: dict[str] = {
         "Server": f"{ctx_i.guild.name} ({ctx_i.guild.id})",
         "Command": ctx_i.command.name,
-        "Author": f"{str(user)} ({user.id})",
+        "Author": f"{user_name} ({user.id})",
     }
-    if isinstance(ctx_i, commands.Context):
+    if is_context:
         data["Original message"] = ctx_i.message.content
         data["Link to message"] = ctx_i.message.jump_url
 
     await log_data(
         bot,
         f"{ctx_i.command.name!r} "
-        f"{'app ' if isinstance(ctx_i, discord.Interaction) or ctx_i.interaction else ''}"
-        f"command failed for {str(user)!r} ({user.id!r})",
+        f"{'app ' if not is_context or ctx_i.interaction else ''}"
+        f"command failed for {user_name!r} ({user.id!r})",
         data, logger=logger, exc_info=(type(err), err, err.__traceback__))
 
 
+@functools.lru_cache(maxsize=1)
+def _format_log_date(timestamp: int, date_format: str) -> str:
+    """
+    Format the date of a log message, only once per second as errors often come in bursts
+
+    :param timestamp: The timestamp of the log, in seconds
+    :param date_format: The format of the date, without sub-second directives
+    :return: The formatted date
+    """
+
+    return dt.datetime.fromtimestamp(timestamp).strftime(date_format)
+
+
+def _get_traceback_entry(traceback: types.TracebackType, index: Optional[int] = None) -> types.TracebackType:
+    """
+    Get an entry of a traceback by following its links, without extracting the
+    frames' source lines like `traceback.extract_tb` does
+
+    :param traceback: The first entry of the traceback
+    :param index: The index of the entry to get, or None for the last one.
+        The last entry is returned if the traceback is shorter
+    :return: The traceback entry
+    """
+
+    while traceback.tb_next is not None and (index is None or index > 0):
+        traceback = traceback.tb_next
+        if index is not None:
+            index -= 1
+    return traceback
+
+
 async def log_data(
         bot: commands.Bot, message: str, data: dict,
         logger: logging.Logger = logging.getLogger(__name__),
         level: int = logging.ERROR,
         exc_info: Union[bool, tuple] = True) -> None:
     """
-    Logs data to the console and to the log channel
+    Logs data to the console and to the log channel. The message sent to the log
+    channel is queued, and merged with the other pending ones when possible
 
     :param bot: The bot instance
     :param message: The message to log
@@ -538,19 +910,22 @@ async def log_data(
         exc_info = sys.exc_info()
 
     traceback = message
-    data["Date"] = dt.datetime.today().strftime(config.log.date_format)
+    date_format = config.log.date_format
+    if '%f' in date_format:
+        data["Date"] = dt.datetime.today().strftime(date_format)
+    else:
+        data["Date"] = _format_log_date(int(time.time()), date_format)
 
     if exc_info:
         err_type, err_value, err_traceback = exc_info
-        tb_infos = tb.extract_tb(err_traceback)[-1]
-        unenclosed_tb = (
-                "".join(tb.format_tb(err_traceback))
-                + "".join(tb.format_exception_only(err_type, err_value)))
+        # the stack is extracted once, for both the traceback and the location of the error
+        stack = tb.extract_tb(err_traceback)
+        unenclosed_tb = "".join(stack.format() + tb.format_exception_only(err_type, err_value))
 
         traceback = f"```\n{sanitize(unenclosed_tb, 1992, replace_newline=False)}\n```"
 
-        data["File"] = tb_infos.filename
-        data["Line"] = tb_infos.lineno
+        data["File"] = stack[-1].filename
+        data["Line"] = stack[-1].lineno
         data["Error"] = err_type.__name__
         data["Description"] = str(err_value)
 
@@ -558,29 +933,131 @@ async def log_data(
         level,
         (
             message + "\n"
-            + "\n".join(
+            + "\n".join([
                 f"\t{key}: " + (f"'{value}'" if isinstance(value, str) else str(value))
-                for key, value in data.items())
+                for key, value in data.items()])
         ),
         exc_info=exc_info
     )
 
-    if not config.log.channel:
+    # read without addict creating an empty Dict when no log channel is configured
+    channel_id = config.log.get('channel')
+    if not channel_id:
         return
 
-    channel = bot.get_channel(config.log.channel)
+    channel = bot.get_channel(channel_id)
 
     if channel is None:
-        logger.error(f"Could not send log message: channel {config.log.channel!r} not found")
+        logger.error(f"Could not send log message: channel {channel_id!r} not found")
         return
 
-    embed = discord.Embed(title=message)
+    embed = discord.Embed.from_dict({
+        "title": message,
+        "fields": [{"name": str(key), "value": str(value), "inline": False} for key, value in data.items()]
+    })
     set_embed_footer(bot, embed)
 
-    for key, value in data.items():
-        embed.add_field(name=key, value=value, inline=False)
+    _queue_log_message(channel, traceback, embed)
+
+
+# The pending log messages and the task sending them, per log channel id
+_log_channel_queues: dict = {}
+
 
-    await channel.send(traceback, embed=embed)
+def _queue_log_message(channel: discord.abc.Messageable, content: str, embed: discord.Embed) -> None:
+    pending = _log_channel_queues.get(channel.id)
+    if pending is None or pending[1].done():
+        log_queue = asyncio.Queue()
+        pending = _log_channel_queues[channel.id] = (log_queue, asyncio.create_task(
+            _send_log_messages(channel, log_queue)))
+    pending[0].put_nowait((content, embed))
+
+
+async def _send_log_messages(channel: discord.abc.Messageable, log_queue: asyncio.Queue) -> None:
+    """
+    Sends the queued log messages to the log channel, merging the ones pending
+    at the same time into as few messages as Discord allows
+    """
+
+    while True:
+        entries = [await log_queue.get()]
+        while not log_queue.empty():
+            entries.append(log_queue.get_nowait())
+
+        try:
+            await _send_log_entries(channel, entries)
+        finally:
+            for _ in entries:
+                log_queue.task_done()
+
+
+async def _send_log_entries(channel: discord.abc.Messageable, entries: list) -> None:
+    batches = []
+    contents, embeds, embeds_len = [], [], 0
+    for content, embed in entries:
+        if embeds and (
+                len(embeds) == 10 or embeds_len + len(embed) > 6000
+                or sum(map(len, contents)) + len(contents) + len(content) > 2000):
+            batches.append((contents, embeds))
+            contents, embeds, embeds_len = [], [], 0
+        contents.append(content)
+        embeds.append(embed)
+        embeds_len += len(embed)
+    batches.append((contents, embeds))
+
+    for contents, embeds in batches:
+        if len(embeds) == 1:
+            await _send_log_message(channel, contents[0], embeds[0])
+            continue
+        try:
+            await channel.send("\n".join(contents), embeds=embeds)
+            continue
+        except Exception:
+            pass
+        # a single rejected entry fails the whole batch, so the entries are sent
+        # again one by one, to only lose the faulty ones
+        for content, embed in zip(contents, embeds):
+            await _send_log_message(channel, content, embed)
+
+
+async def _send_log_message(channel: discord.abc.Messageable, content: str, embed: discord.Embed) -> None:
+    try:
+        await channel.send(content, embed=embed)
+    except Exception:
+        logging.getLogger(__name__).exception("Could not send log message to channel %r", channel.id)
+
+
+async def _flush_log_messages(timeout: float = 10) -> None:
+    """
+    Sends the log messages still queued and stops the tasks sending them,
+    e.g. before the bot closes
+
+    :param timeout: The maximum time to wait for each log channel, in seconds
+    :return: None
+    """
+
+    while _log_channel_queues:
+        channel_id, (log_queue, task) = _log_channel_queues.popitem()
+        if not task.done():
+            try:
+                await asyncio.wait_for(log_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logging.getLogger(__name__).warning(
+                    "Could not send all the log messages to channel %r before closing", channel_id)
+            task.cancel()
+
+
+# The units of the footer deletion delay, with their length in seconds
+_FOOTER_UNITS = (('days', 86400), ('hours', 3600), ('minutes', 60), ('seconds', 1))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_footer_base(
+        user: discord.ClientUser, name: str, avatar: Optional[str], locale: str, version: Optional[str]
+) -> tuple:
+    # the name, avatar and locale are only part of the key, to renew the footer when they change
+    info = (name, i18n.t('footer.version', version=version)) if version else (name,)
+    return info, user.display_avatar.url
 
 
 def set_embed_footer(
@@ -601,30 +1078,30 @@ def set_embed_footer(
     :return: None
     """
 
-    info = [bot.user.name]
+    user = bot.user
+    avatar = user.avatar.key if user.avatar else None
+    if config.hot_reload:
+        base_info, icon_url = _get_footer_base.__wrapped__(
+            user, user.name, avatar, i18n.get('locale'), config.version)
+    else:
+        base_info, icon_url = _get_footer_base(
+            user, user.name, avatar, i18n.get('locale'), config.version)
 
-    if config.version:
-        info.append(i18n.t('footer.version', version=config.version))
-    info.extend(sup)
+    info = [*base_info, *sup]
     if timeout:
-        relative = filter(
-            lambda i: i[1] > 0,
-            {
-                'days': int(timeout // 86400),
-                'hours': int(timeout // 3600) % 24,
-                'minutes': int(timeout // 60) % 60,
-                'seconds': int(timeout % 60),
-            }.items())
-
-        delay = " ".join(
-            str(value) + i18n.t(f'footer.units.{unit}')
-            for unit, value in relative)
+        remaining = int(timeout)
+        delay = []
+        for unit, length in _FOOTER_UNITS:
+            value, remaining = divmod(remaining, length)
+            if value > 0:
+                delay.append(str(value) + translate(f'footer.units.{unit}'))
+        delay = " ".join(delay)
 
         info.append(i18n.t('footer.timeout', delay=delay))
 
     embed.set_footer(
         text=" | ".join(info),
-        icon_url=bot.user.display_avatar.url
+        icon_url=icon_url
     )
     if set_color and (embed.colour is None) and config.color:
         embed.colour = config.color
@@ -637,7 +1114,9 @@ class CaseInsensitiveStringView(commands.bot.StringView):
 
     def skip_string(self, string: str) -> bool:
         strlen = len(string)
-        if self.buffer[self.index: self.index + strlen].lower() == string.lower():
+        # exact matches, the most common ones, are checked without slicing or lowering anything
+        if (self.buffer.startswith(string, self.index)
+                or self.buffer[self.index: self.index + strlen].lower() == string.lower()):
             self.previous = self.index
             self.index += strlen
             return True